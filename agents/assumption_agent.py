@@ -8,7 +8,7 @@ from core.models import Assumptions
 
 
 class AssumptionAgent:
-    """Perform additional validation on top of Pydantic constraints."""
+    """Perform additional validation on top of the model constraints."""
 
     @staticmethod
     def validate(
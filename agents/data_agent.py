@@ -7,15 +7,19 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from core._fastcsv import write_numeric_csv
 from core.models import Assumptions, Settings
 
 
 class DataAgent:
-    """Load revenue data from disk or generate a synthetic series."""
+    """Load revenue data from disk or generate a synthetic series.
+
+    ``settings.data_dir`` must already exist; call ``Settings.resolve_paths``
+    first when using the agent outside ``Planner``.
+    """
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.settings.resolve_paths()
 
     def load_csv(self, relative_path: Path) -> pd.DataFrame:
         """Load a CSV file containing a revenue column."""
@@ -39,18 +43,11 @@ class DataAgent:
 
         rng = np.random.default_rng(seed=42)
         base_revenue = assumptions.starting_revenue / (1 + assumptions.growth_rate)
-        revenues = []
-        current = base_revenue
-        for _ in range(periods):
-            noise = rng.normal(loc=0.0, scale=0.02)
-            current *= 1 + assumptions.growth_rate + noise
-            revenues.append(max(current, 0.0))
-        df = pd.DataFrame(
-            {
-                "year": list(range(-periods + 1, 1)),
-                "revenue": revenues,
-            }
-        )
+        noise = rng.normal(loc=0.0, scale=0.02, size=periods)
+        growth = 1 + assumptions.growth_rate + noise
+        revenues = np.maximum(base_revenue * np.cumprod(growth), 0.0)
+        years = np.arange(-periods + 1, 1)
+        df = pd.DataFrame({"year": years, "revenue": revenues})
         output_path = self.settings.data_dir / "synthetic_revenue.csv"
-        df.to_csv(output_path, index=False)
+        write_numeric_csv(output_path, ["year", "revenue"], [years, revenues])
         return df
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
 
-from core.models import Assumptions, Results, Settings
+from core.models import (
+    Assumptions,
+    Results,
+    ScenarioResult,
+    SensitivityPoint,
+    Settings,
+)
 from core.scenarios import build_scenarios
 
 from .assumption_agent import AssumptionAgent
@@ -16,6 +23,15 @@ from .report_agent import ReportAgent
 from .sensitivity_agent import SensitivityAgent
 
 
+@dataclass(frozen=True)
+class PipelineAnalysis:
+    """Computed pipeline outputs, before anything is written to disk."""
+
+    scenarios: list[ScenarioResult]
+    sensitivity: list[SensitivityPoint]
+    data: pd.DataFrame
+
+
 class Planner:
     """Coordinates the data, validation, projection, and reporting agents."""
 
@@ -43,19 +59,39 @@ class Planner:
     ) -> Results:
         """Execute the full pipeline and return the structured results."""
 
+        analysis = self.analyze(assumptions, csv_path, historical_df)
+        return self.report(analysis)
+
+    def analyze(
+        self,
+        assumptions: Assumptions,
+        csv_path: Path | None = None,
+        historical_df: pd.DataFrame | None = None,
+    ) -> PipelineAnalysis:
+        """Validate the inputs and compute scenario and sensitivity results."""
+
+        self.settings.resolve_paths()
         data = self._resolve_data(assumptions, csv_path, historical_df)
         validated_assumptions = self.assumption_agent.validate(assumptions, data)
         scenarios = build_scenarios(validated_assumptions)
         scenario_results = self.projection_agent.run(validated_assumptions, scenarios)
-        sensitivity_points, sensitivity_artifacts = self.sensitivity_agent.run(
-            validated_assumptions, scenarios[0]
+        sensitivity_points = self.sensitivity_agent.sweep(
+            validated_assumptions, scenarios[0], baseline=scenario_results[0]
         )
+        return PipelineAnalysis(scenario_results, sensitivity_points, data)
+
+    def report(self, analysis: PipelineAnalysis) -> Results:
+        """Write the artifacts for ``analysis`` and assemble the results payload."""
+
+        # Resolved per run so a directory removed while the app is up is recreated.
+        self.settings.resolve_paths()
         report_artifacts = self.report_agent.save(
-            scenario_results, sensitivity_points, data
+            analysis.scenarios, analysis.sensitivity, analysis.data
         )
+        sensitivity_artifacts = self.sensitivity_agent.persist(analysis.sensitivity)
         artifacts = {**report_artifacts, **sensitivity_artifacts}
         return ReportAgent.to_results(
-            scenario_results, sensitivity_points, artifacts, data
+            analysis.scenarios, analysis.sensitivity, artifacts, analysis.data
         )
 
     def _resolve_data(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
-from core.dcf import run_dcf
+from core.dcf import run_dcf_batch
 from core.models import Assumptions, ScenarioParams, ScenarioResult
 
 
@@ -16,7 +16,4 @@ class ProjectionAgent:
     ) -> list[ScenarioResult]:
         """Return scenario-level DCF results."""
 
-        results: list[ScenarioResult] = []
-        for scenario in scenarios:
-            results.append(run_dcf(assumptions, scenario))
-        return results
+        return run_dcf_batch(assumptions, list(scenarios))
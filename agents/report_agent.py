@@ -4,17 +4,22 @@ from __future__ import annotations
 
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
+from core._fastcsv import write_frame_csv, write_numeric_csv, write_rows_csv
 from core.models import Results, ScenarioResult, SensitivityPoint, Settings
 
 
 class ReportAgent:
-    """Save scenario summaries, FCFF tables, and collate artifact paths."""
+    """Save scenario summaries, FCFF tables, and collate artifact paths.
+
+    ``settings.output_dir`` must already exist; call ``Settings.resolve_paths``
+    first when using the agent outside ``Planner``.
+    """
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.settings.resolve_paths()
 
     def save(
         self,
@@ -26,42 +31,44 @@ class ReportAgent:
 
         artifact_paths: dict[str, str] = {}
 
-        summary_df = pd.DataFrame(
+        summary_path = self.settings.output_dir / "scenario_summary.csv"
+        write_rows_csv(
+            summary_path,
+            ["scenario", "wacc", "npv", "irr"],
             [
-                {
-                    "scenario": scenario.name,
-                    "wacc": scenario.wacc,
-                    "npv": scenario.npv,
-                    "irr": scenario.irr if scenario.irr is not None else "",
-                }
+                (
+                    scenario.name,
+                    scenario.wacc,
+                    scenario.npv,
+                    scenario.irr if scenario.irr is not None else "",
+                )
                 for scenario in scenarios
-            ]
+            ],
         )
-        summary_path = self.settings.output_dir / "scenario_summary.csv"
-        summary_df.to_csv(summary_path, index=False)
         artifact_paths["scenario_summary"] = str(summary_path)
 
         for scenario in scenarios:
-            fcff_df = pd.DataFrame(
-                {
-                    "year": list(range(1, len(scenario.fcff) + 1)),
-                    "revenue": scenario.revenues,
-                    "fcff": scenario.fcff,
-                }
-            )
+            fcff_columns = [
+                np.arange(1, len(scenario.fcff) + 1),
+                np.asarray(scenario.revenues),
+                np.asarray(scenario.fcff),
+            ]
             fcff_path = self.settings.output_dir / f"fcff_{scenario.name.lower()}.csv"
-            fcff_df.to_csv(fcff_path, index=False)
+            write_numeric_csv(fcff_path, ["year", "revenue", "fcff"], fcff_columns)
             artifact_paths[f"fcff_{scenario.name.lower()}"] = str(fcff_path)
 
         if sensitivity:
-            sensitivity_df = pd.DataFrame([point.dict() for point in sensitivity])
+            sensitivity_columns = [
+                np.fromiter((point.wacc for point in sensitivity), np.float64),
+                np.fromiter((point.npv for point in sensitivity), np.float64),
+            ]
             sensitivity_csv = self.settings.output_dir / "sensitivity_overview.csv"
-            sensitivity_df.to_csv(sensitivity_csv, index=False)
+            write_numeric_csv(sensitivity_csv, ["wacc", "npv"], sensitivity_columns)
             artifact_paths["sensitivity_overview"] = str(sensitivity_csv)
 
         if data_preview is not None:
             data_path = self.settings.output_dir / "historical_data_preview.csv"
-            data_preview.to_csv(data_path, index=False)
+            write_frame_csv(data_path, data_preview)
             artifact_paths["historical_data_preview"] = str(data_path)
 
         return artifact_paths
@@ -75,12 +82,14 @@ class ReportAgent:
     ) -> Results:
         """Assemble the pipeline results payload."""
 
-        fcff_table: list[dict[str, float | int]] = []
-        for index in range(len(scenarios[0].fcff)):
-            row: dict[str, float | int] = {"year": index + 1}
-            for scenario in scenarios:
-                row[f"{scenario.name}_fcff"] = scenario.fcff[index]
-            fcff_table.append(row)
+        fcff_matrix = np.column_stack([scenario.fcff for scenario in scenarios])
+        fcff_df = pd.DataFrame(
+            fcff_matrix, columns=[f"{scenario.name}_fcff" for scenario in scenarios]
+        )
+        fcff_df.insert(0, "year", np.arange(1, len(fcff_matrix) + 1))
+        fcff_table = cast(
+            list[dict[str, float | int]], fcff_df.to_dict(orient="records")
+        )
 
         preview_records: list[dict[str, float | int]] = []
         if data_preview is not None:
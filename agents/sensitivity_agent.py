@@ -2,65 +2,124 @@
 
 from __future__ import annotations
 
+import math
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
-from core.dcf import run_dcf
-from core.models import Assumptions, ScenarioParams, SensitivityPoint, Settings
+from core._fastcsv import write_numeric_csv
+from core.dcf import Projection, npv_for_waccs, project_cash_flows
+from core.models import (
+    Assumptions,
+    ScenarioParams,
+    ScenarioResult,
+    SensitivityPoint,
+    Settings,
+)
+from core.scenarios import prepare_scenario
 
 
 class SensitivityAgent:
-    """Produce a one-dimensional WACC sensitivity table and plot."""
+    """Produce a one-dimensional WACC sensitivity table and, optionally, a plot.
 
-    def __init__(self, settings: Settings) -> None:
+    ``settings.output_dir`` must already exist before ``run`` or ``persist``;
+    call ``Settings.resolve_paths`` first when using the agent outside ``Planner``.
+    """
+
+    def __init__(self, settings: Settings, generate_plot: bool = False) -> None:
         self.settings = settings
-        self.settings.resolve_paths()
+        self.generate_plot = generate_plot
 
     def run(
-        self, assumptions: Assumptions, scenario: ScenarioParams
+        self,
+        assumptions: Assumptions,
+        scenario: ScenarioParams,
+        baseline: ScenarioResult | None = None,
     ) -> tuple[list[SensitivityPoint], dict[str, str]]:
-        """Sweep WACC values around the scenario baseline."""
+        """Sweep WACC values around the scenario baseline and persist the results."""
+
+        points = self.sweep(assumptions, scenario, baseline=baseline)
+        return points, self.persist(points)
+
+    def sweep(
+        self,
+        assumptions: Assumptions,
+        scenario: ScenarioParams,
+        baseline: ScenarioResult | None = None,
+    ) -> list[SensitivityPoint]:
+        """Sweep WACC values around the scenario baseline.
+
+        When ``baseline`` holds the already computed result for ``scenario``,
+        its FCFF projection is reused instead of being projected again. A
+        baseline from a different scenario raises ``ValueError``.
+        """
 
         start = max(0.02, scenario.wacc - 0.04)
         stop = min(0.3, scenario.wacc + 0.04)
         wacc_values = np.round(np.arange(start, stop + 0.0001, 0.005), decimals=3)
 
-        points: list[SensitivityPoint] = []
-        for wacc in wacc_values:
-            params = ScenarioParams(
-                name=scenario.name, growth_rate=scenario.growth_rate, wacc=float(wacc)
+        # Only discounting depends on WACC, so project FCFF once for the sweep.
+        if baseline is not None:
+            projection = self._baseline_projection(assumptions, scenario, baseline)
+        else:
+            projection = project_cash_flows(assumptions, scenario)
+        npv_values = npv_for_waccs(assumptions, projection, wacc_values)
+        return [
+            SensitivityPoint(wacc=float(wacc), npv=float(npv))
+            for wacc, npv in zip(wacc_values, npv_values, strict=True)
+        ]
+
+    @staticmethod
+    def _baseline_projection(
+        assumptions: Assumptions, scenario: ScenarioParams, baseline: ScenarioResult
+    ) -> Projection:
+        prepared = prepare_scenario(assumptions, scenario)
+        first_revenue = prepared.starting_revenue * (1 + prepared.growth_rate)
+        if (
+            baseline.name != prepared.name
+            or baseline.wacc != prepared.wacc
+            or len(baseline.fcff) != prepared.years
+            or not math.isclose(baseline.revenues[0], first_revenue, rel_tol=1e-12)
+            or not math.isclose(
+                baseline.fcff[0], first_revenue * prepared.fcff_coef, rel_tol=1e-12
             )
-            result = run_dcf(assumptions, params)
-            points.append(SensitivityPoint(wacc=float(wacc), npv=result.npv))
+        ):
+            raise ValueError("Baseline result was computed for a different scenario.")
+        return Projection(
+            revenues=np.asarray(baseline.revenues, dtype=np.float64),
+            fcff=np.asarray(baseline.fcff, dtype=np.float64),
+            terminal_value=baseline.terminal_value,
+        )
 
-        artifacts = self._persist(points)
-        return points, artifacts
+    def persist(self, points: list[SensitivityPoint]) -> dict[str, str]:
+        """Write the sweep to CSV (and the optional plot) and return artifact paths."""
 
-    def _persist(self, points: list[SensitivityPoint]) -> dict[str, str]:
-        df = pd.DataFrame([point.dict() for point in points])
+        wacc = np.fromiter((point.wacc for point in points), np.float64)
+        npv = np.fromiter((point.npv for point in points), np.float64)
         csv_path = self.settings.output_dir / "sensitivity_wacc.csv"
-        df.to_csv(csv_path, index=False)
+        write_numeric_csv(csv_path, ["wacc", "npv"], [wacc, npv])
+        artifacts = {"sensitivity_csv": str(csv_path)}
 
-        plot_path = self.settings.output_dir / "sensitivity_wacc.png"
-        self._plot(df, plot_path)
+        # The UI charts the CSV data directly, so the PNG is only rendered on request.
+        if self.generate_plot:
+            plot_path = self.settings.output_dir / "sensitivity_wacc.png"
+            self._plot(wacc, npv, plot_path)
+            artifacts["sensitivity_plot"] = str(plot_path)
 
-        return {
-            "sensitivity_csv": str(csv_path),
-            "sensitivity_plot": str(plot_path),
-        }
+        return artifacts
 
     @staticmethod
-    def _plot(df: pd.DataFrame, output_path: Path) -> None:
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.plot(df["wacc"], df["npv"], marker="o")
+    def _plot(wacc: np.ndarray, npv: np.ndarray, output_path: Path) -> None:
+        # Deferred so importing the agent does not pay for matplotlib. A bare
+        # Figure avoids pyplot's global state, so concurrent runs never share axes.
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        ax.plot(wacc, npv, marker="o")
         ax.set_xlabel("WACC")
         ax.set_ylabel("NPV")
         ax.set_title("NPV Sensitivity to WACC")
         ax.grid(True, which="both", linestyle="--", linewidth=0.5)
         fig.tight_layout()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(output_path, dpi=150)
-        plt.close(fig)
+        fig.savefig(output_path, dpi=100)
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+
+# Streamlit runs this script on a worker thread, and TBB can hang the process at
+# exit after a parallel Numba launch from such a thread. The app's small batches
+# run serially, but prefer OpenMP for larger ones unless the user chose a layer;
+# this must be set before Numba is first imported.
+os.environ.setdefault("NUMBA_THREADING_LAYER_PRIORITY", "omp tbb workqueue")
+
+from dataclasses import astuple
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from pydantic import ValidationError
 
-from agents.planner import Planner
+from agents.planner import PipelineAnalysis, Planner
 from core.models import Assumptions, Results, Settings
 
 st.set_page_config(page_title="Financial DCF Demo", layout="wide")
@@ -38,9 +46,14 @@ if "historical_df" not in st.session_state:
 if "results" not in st.session_state:
     st.session_state["results"] = None
 
-settings = Settings()
-settings.resolve_paths()
-planner = Planner(settings)
+
+@st.cache_resource
+def _load_planner() -> Planner:
+    # Built once per server process so reruns skip settings and agent setup.
+    return Planner(Settings())
+
+
+planner = _load_planner()
 
 tab_data, tab_assumptions, tab_results = st.tabs(
     ["Data", "Assumptions", "Run & Results"]
@@ -51,6 +64,29 @@ def _collect_assumptions() -> dict[str, Any]:
     return {key: st.session_state[key] for key in DEFAULT_ASSUMPTIONS}
 
 
+def _hash_dataframe(df: pd.DataFrame | None) -> str | None:
+    if df is None:
+        return None
+    # Row hashes ignore column names and dtypes, so include them in the key; a
+    # renamed column must miss the cache and fail validation again.
+    rows = pd.util.hash_pandas_object(df).sum()
+    return str((tuple(map(str, df.columns)), tuple(map(str, df.dtypes)), rows))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_analysis(
+    assumption_values: tuple[Any, ...],
+    data_hash: str | None,
+    _historical_df: pd.DataFrame | None,
+) -> PipelineAnalysis:
+    # Keyed on the assumption values and data hash; the dataframe itself is
+    # excluded from Streamlit's argument hashing by its leading underscore.
+    # Artifacts are written outside the cache so the files on disk always
+    # match the results being shown.
+    assumptions = Assumptions(*assumption_values)
+    return planner.analyze(assumptions, historical_df=_historical_df)
+
+
 with tab_data:
     st.subheader("Revenue Data")
     st.write(
@@ -66,10 +102,11 @@ with tab_data:
     if st.button("Generate synthetic data", key="generate_synthetic"):
         try:
             assumptions = Assumptions(**_collect_assumptions())
+            planner.settings.resolve_paths()
             synthetic = planner.data_agent.generate_synthetic(assumptions)
             st.session_state["historical_df"] = synthetic
             st.success(f"Generated synthetic data saved to {synthetic.shape[0]} rows.")
-        except ValidationError as error:
+        except ValueError as error:
             st.error(f"Cannot generate data: {error}")
 
     data_preview = st.session_state.get("historical_df")
@@ -156,11 +193,12 @@ with tab_results:
         try:
             assumptions = Assumptions(**_collect_assumptions())
             data_df = st.session_state.get("historical_df")
-            pipeline_results = planner.run_pipeline(assumptions, historical_df=data_df)
+            analysis = _cached_analysis(
+                astuple(assumptions), _hash_dataframe(data_df), data_df
+            )
+            pipeline_results = planner.report(analysis)
             st.session_state["results"] = pipeline_results
             st.success("Pipeline completed successfully.")
-        except ValidationError as error:
-            st.error(f"Validation error: {error}")
         except ValueError as error:
             st.error(f"Pipeline failed: {error}")
 
@@ -192,15 +230,15 @@ with tab_results:
         st.dataframe(fcff_df, use_container_width=True)
 
         st.markdown("#### WACC sensitivity")
+        sensitivity = stored_results.sensitivity
         sensitivity_df = pd.DataFrame(
-            [point.dict() for point in stored_results.sensitivity]
+            {
+                "wacc": np.fromiter((point.wacc for point in sensitivity), np.float64),
+                "npv": np.fromiter((point.npv for point in sensitivity), np.float64),
+            }
         )
         st.line_chart(sensitivity_df, x="wacc", y="npv")
 
-        plot_path = stored_results.artifacts.get("sensitivity_plot")
-        if plot_path and Path(plot_path).exists():
-            st.image(plot_path, caption="Sensitivity curve", use_column_width=True)
-
         st.markdown("#### Artifacts")
         for label, path in stored_results.artifacts.items():
             st.write(f"- **{label}**: `{path}`")
@@ -0,0 +1,219 @@
+"""Numba-compiled kernels backing the DCF helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+# Candidate rates scanned for the first NPV sign change before root finding.
+IRR_BRACKETS = np.array([-0.9, -0.5, 0.0, 0.25, 1.0, 4.0])
+IRR_XTOL = 1e-7
+IRR_RTOL = 4 * np.finfo(np.float64).eps
+IRR_MAX_ITERATIONS = 100
+# Below this many rows the thread-pool launch costs more than the rows do.
+PARALLEL_MIN_ROWS = 1024
+
+
+@njit(cache=True, fastmath=True)
+def npv_horner(rate: float, cash_flows: np.ndarray) -> float:
+    """Evaluate the NPV polynomial in ``1 / (1 + rate)`` with Horner's rule."""
+
+    x = 1.0 / (1.0 + rate)
+    total = 0.0
+    for period in range(cash_flows.shape[0] - 1, -1, -1):
+        total = total * x + cash_flows[period]
+    return total
+
+
+@njit(cache=True)
+def brent_root(cash_flows: np.ndarray, lower: float, upper: float) -> float:
+    """Find the NPV root in ``[lower, upper]`` with Brent's method.
+
+    Mirrors the step logic of ``scipy.optimize.brentq``; the bracket must
+    straddle a sign change. Returns NaN if it does not converge within
+    ``IRR_MAX_ITERATIONS`` steps.
+    """
+
+    x_prev, x_curr = lower, upper
+    f_prev = npv_horner(x_prev, cash_flows)
+    f_curr = npv_horner(x_curr, cash_flows)
+    if f_prev == 0.0:
+        return x_prev
+    if f_curr == 0.0:
+        return x_curr
+
+    x_block, f_block = 0.0, 0.0
+    step_prev, step_curr = 0.0, 0.0
+    for _ in range(IRR_MAX_ITERATIONS):
+        if f_prev != 0.0 and f_curr != 0.0 and (f_prev < 0.0) != (f_curr < 0.0):
+            x_block, f_block = x_prev, f_prev
+            step_prev = step_curr = x_curr - x_prev
+        if abs(f_block) < abs(f_curr):
+            x_prev, x_curr, x_block = x_curr, x_block, x_curr
+            f_prev, f_curr, f_block = f_curr, f_block, f_curr
+
+        delta = (IRR_XTOL + IRR_RTOL * abs(x_curr)) / 2
+        step_bisect = (x_block - x_curr) / 2
+        if f_curr == 0.0 or abs(step_bisect) < delta:
+            return x_curr
+
+        if abs(step_prev) > delta and abs(f_curr) < abs(f_prev):
+            if x_prev == x_block:
+                # Secant interpolation.
+                step_try = -f_curr * (x_curr - x_prev) / (f_curr - f_prev)
+            else:
+                # Inverse quadratic extrapolation.
+                d_prev = (f_prev - f_curr) / (x_prev - x_curr)
+                d_block = (f_block - f_curr) / (x_block - x_curr)
+                step_try = (
+                    -f_curr
+                    * (f_block * d_block - f_prev * d_prev)
+                    / (d_block * d_prev * (f_block - f_prev))
+                )
+            if 2 * abs(step_try) < min(abs(step_prev), 3 * abs(step_bisect) - delta):
+                step_prev, step_curr = step_curr, step_try
+            else:
+                step_prev = step_curr = step_bisect
+        else:
+            step_prev = step_curr = step_bisect
+
+        x_prev, f_prev = x_curr, f_curr
+        if abs(step_curr) > delta:
+            x_curr += step_curr
+        else:
+            x_curr += delta if step_bisect > 0 else -delta
+        f_curr = npv_horner(x_curr, cash_flows)
+    return np.nan
+
+
+@njit(cache=True)
+def irr_bracketed(cash_flows: np.ndarray) -> float:
+    """Return the IRR of ``cash_flows`` or NaN when no root is bracketed."""
+
+    has_positive = False
+    has_negative = False
+    for value in cash_flows:
+        has_positive = has_positive or value > 0
+        has_negative = has_negative or value < 0
+    if not (has_positive and has_negative):
+        return np.nan
+
+    lower = IRR_BRACKETS[0]
+    lower_npv = npv_horner(lower, cash_flows)
+    for index in range(1, IRR_BRACKETS.shape[0]):
+        upper = IRR_BRACKETS[index]
+        upper_npv = npv_horner(upper, cash_flows)
+        if lower_npv * upper_npv <= 0:
+            return brent_root(cash_flows, lower, upper)
+        lower, lower_npv = upper, upper_npv
+    return np.nan
+
+
+# No fastmath here: it would let LLVM replace the per-step division in the NPV
+# recurrence with a multiply by a hoisted reciprocal.
+@njit(cache=True)
+def _value_row(
+    row: int,
+    fcff: np.ndarray,
+    wacc: np.ndarray,
+    terminal_growth: float,
+    initial_outlay: float,
+    with_irr: bool,
+    terminal: np.ndarray,
+    npv: np.ndarray,
+    irr: np.ndarray,
+) -> None:
+    years = fcff.shape[1]
+    rate = wacc[row]
+    terminal[row] = (
+        fcff[row, years - 1] * (1 + terminal_growth) / (rate - terminal_growth)
+    )
+
+    # Discount backwards from the terminal year: PV_{k-1} = (PV_k + C_k) / (1 + r),
+    # one correctly rounded division per year and no discount-factor powers.
+    one_plus_rate = 1.0 + rate
+    present_value = terminal[row]
+    for year in range(years - 1, -1, -1):
+        present_value = (present_value + fcff[row, year]) / one_plus_rate
+    npv[row] = present_value
+
+    if with_irr:
+        cash_flows = np.empty(years + 2)
+        cash_flows[0] = initial_outlay
+        cash_flows[1 : years + 1] = fcff[row]
+        cash_flows[years + 1] = terminal[row]
+        irr[row] = irr_bracketed(cash_flows)
+
+
+@njit(cache=True)
+def _value_rows_serial(
+    fcff: np.ndarray,
+    wacc: np.ndarray,
+    terminal_growth: float,
+    initial_outlay: float,
+    with_irr: bool,
+    terminal: np.ndarray,
+    npv: np.ndarray,
+    irr: np.ndarray,
+) -> None:
+    for row in range(fcff.shape[0]):
+        _value_row(
+            row,
+            fcff,
+            wacc,
+            terminal_growth,
+            initial_outlay,
+            with_irr,
+            terminal,
+            npv,
+            irr,
+        )
+
+
+@njit(parallel=True, cache=True)
+def _value_rows_parallel(
+    fcff: np.ndarray,
+    wacc: np.ndarray,
+    terminal_growth: float,
+    initial_outlay: float,
+    with_irr: bool,
+    terminal: np.ndarray,
+    npv: np.ndarray,
+    irr: np.ndarray,
+) -> None:
+    for row in prange(fcff.shape[0]):
+        _value_row(
+            row,
+            fcff,
+            wacc,
+            terminal_growth,
+            initial_outlay,
+            with_irr,
+            terminal,
+            npv,
+            irr,
+        )
+
+
+def dcf_batch(
+    fcff: np.ndarray,
+    wacc: np.ndarray,
+    terminal_growth: float,
+    initial_outlay: float,
+    with_irr: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Value each FCFF row at its WACC, returning terminal values, NPVs and IRRs.
+
+    IRRs are NaN when ``with_irr`` is false or no root is found. Rows are
+    independent, so batches of at least ``PARALLEL_MIN_ROWS`` rows are spread
+    across threads with ``prange``; smaller ones run serially, without the
+    thread-pool launch.
+    """
+
+    rows = fcff.shape[0]
+    terminal = np.empty(rows)
+    npv = np.empty(rows)
+    irr = np.full(rows, np.nan)
+    kernel = _value_rows_parallel if rows >= PARALLEL_MIN_ROWS else _value_rows_serial
+    kernel(fcff, wacc, terminal_growth, initial_outlay, with_irr, terminal, npv, irr)
+    return terminal, npv, irr
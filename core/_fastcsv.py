@@ -0,0 +1,52 @@
+"""Lightweight CSV writers for small numeric artifacts."""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def write_numeric_csv(
+    path: Path, col_names: Sequence[str], columns: Sequence[np.ndarray]
+) -> None:
+    """Write numeric columns with a header row, bypassing pandas.
+
+    ``tolist`` yields Python ints and floats, which the csv module writes with
+    their shortest round-trip repr, as ``DataFrame.to_csv`` does.
+    """
+
+    rows = zip(*(column.tolist() for column in columns), strict=True)
+    write_rows_csv(path, col_names, rows)
+
+
+def write_rows_csv(
+    path: Path, col_names: Sequence[str], rows: Iterable[Sequence[object]]
+) -> None:
+    """Write mixed-type rows with a header using a single ``writerows`` call."""
+
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(col_names)
+        writer.writerows(rows)
+
+
+def write_frame_csv(path: Path, df: pd.DataFrame) -> None:
+    """Write a dataframe, using the numeric fast path for all-float frames.
+
+    Integer, boolean and object columns go through pandas so large integers and
+    non-numeric values are written unchanged.
+    """
+
+    floats = all(pd.api.types.is_float_dtype(dtype) for dtype in df.dtypes)
+    if floats and not df.isna().to_numpy().any():
+        write_numeric_csv(
+            path,
+            [str(column) for column in df.columns],
+            [df[column].to_numpy() for column in df.columns],
+        )
+    else:
+        df.to_csv(path, index=False)
@@ -4,84 +4,49 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
-from .models import Assumptions, ScenarioParams, ScenarioResult
+import numpy as np
+
+from ._dcf_numba import dcf_batch
+from .models import Assumptions, PreparedScenario, ScenarioParams, ScenarioResult
+from .scenarios import prepare_scenario
 
 
 @dataclass
 class Projection:
     """Container for projected revenues and FCFF."""
 
-    revenues: list[float]
-    fcff: list[float]
+    revenues: np.ndarray
+    fcff: np.ndarray
     terminal_value: float
 
 
-def _project_revenues(start: float, growth_rate: float, years: int) -> list[float]:
-    revenues = []
-    current = start
-    for _ in range(1, years + 1):
-        current *= 1 + growth_rate
-        revenues.append(current)
-    return revenues
+def _project_revenues(
+    start: float, growth_rate: float | np.ndarray, years: int
+) -> np.ndarray:
+    exponents = np.arange(1, years + 1, dtype=np.float64)
+    return start * np.power(1.0 + growth_rate, exponents)
 
 
-def _calculate_fcff(assumptions: Assumptions, revenues: Sequence[float]) -> list[float]:
-    fcff_values: list[float] = []
-    for revenue in revenues:
-        gross_profit = revenue * assumptions.gross_margin
-        opex = revenue * assumptions.opex_pct
-        ebit = gross_profit - opex
-        nopat = ebit * (1 - assumptions.tax_rate)
-        capex = revenue * assumptions.capex_pct
-        delta_nwc = revenue * assumptions.delta_nwc_pct
-        fcff = nopat - capex - delta_nwc
-        fcff_values.append(fcff)
-    return fcff_values
+def _calculate_fcff(fcff_coef: float, revenues: np.ndarray) -> np.ndarray:
+    return revenues * fcff_coef
 
 
-def _terminal_value(last_fcff: float, wacc: float, terminal_growth: float) -> float:
-    if wacc <= terminal_growth:
+def _kernel_array(values: np.ndarray | Sequence[float]) -> np.ndarray:
+    # The Numba kernel is specialised for C-contiguous float64 input; converting
+    # here keeps every call on that one compiled, vectorisable variant.
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _check_terminal_spread(wacc: float | np.ndarray, terminal_growth: float) -> None:
+    if np.any(np.asarray(wacc) <= terminal_growth):
         raise ValueError("Terminal value calculation requires WACC > terminal growth.")
-    return last_fcff * (1 + terminal_growth) / (wacc - terminal_growth)
 
 
-def _discount(values: Sequence[float], wacc: float) -> list[float]:
-    return [value / (1 + wacc) ** (index + 1) for index, value in enumerate(values)]
-
-
-def _npv(discounted_fcff: Sequence[float], discounted_terminal: float) -> float:
-    return float(sum(discounted_fcff) + discounted_terminal)
-
-
-def _irr(cash_flows: Sequence[float]) -> float | None:
-    if not cash_flows:
-        return None
-    has_positive = any(value > 0 for value in cash_flows)
-    has_negative = any(value < 0 for value in cash_flows)
-    if not (has_positive and has_negative):
-        return None
-
-    rate = 0.1
-    tolerance = 1e-6
-    max_iterations = 100
-    for _ in range(max_iterations):
-        npv = 0.0
-        derivative = 0.0
-        for period, value in enumerate(cash_flows):
-            discount = (1 + rate) ** period
-            npv += value / discount
-            if period > 0:
-                derivative -= period * value / ((1 + rate) ** (period + 1))
-        if abs(derivative) < 1e-9:
-            break
-        new_rate = rate - npv / derivative
-        if abs(new_rate - rate) < tolerance:
-            if new_rate > -0.999:
-                return float(new_rate)
-            return None
-        rate = new_rate
-    return None
+def _terminal_value(last_fcff: float, wacc: float, terminal_growth: float) -> float:
+    _check_terminal_spread(wacc, terminal_growth)
+    return last_fcff * (1 + terminal_growth) / (wacc - terminal_growth)
 
 
 def project_cash_flows(
@@ -89,36 +54,97 @@ def project_cash_flows(
 ) -> Projection:
     """Generate deterministic revenue and FCFF projections for a scenario."""
 
+    prepared = prepare_scenario(assumptions, scenario)
     revenues = _project_revenues(
-        start=assumptions.starting_revenue,
-        growth_rate=scenario.growth_rate,
-        years=assumptions.years,
+        start=prepared.starting_revenue,
+        growth_rate=prepared.growth_rate,
+        years=prepared.years,
     )
-    fcff_values = _calculate_fcff(assumptions, revenues)
+    fcff_values = _calculate_fcff(prepared.fcff_coef, revenues)
     terminal = _terminal_value(
-        fcff_values[-1], scenario.wacc, assumptions.terminal_growth
+        float(fcff_values[-1]), prepared.wacc, prepared.terminal_growth
     )
     return Projection(revenues=revenues, fcff=fcff_values, terminal_value=terminal)
 
 
+def npv_for_waccs(
+    assumptions: Assumptions, projection: Projection, wacc_values: np.ndarray
+) -> np.ndarray:
+    """Discount a fixed FCFF projection at each WACC in ``wacc_values``."""
+
+    wacc = _kernel_array(wacc_values)
+    _check_terminal_spread(wacc, assumptions.terminal_growth)
+    fcff = _kernel_array(
+        np.broadcast_to(projection.fcff, (len(wacc), projection.fcff.size))
+    )
+    _, npv, _ = dcf_batch(
+        fcff, wacc, assumptions.terminal_growth, -assumptions.starting_revenue, False
+    )
+    return npv
+
+
+@lru_cache(maxsize=256)
 def run_dcf(assumptions: Assumptions, scenario: ScenarioParams) -> ScenarioResult:
-    """Compute the DCF metrics for a scenario."""
+    """Compute the DCF metrics for a scenario.
+
+    Results are memoised on the frozen inputs; the returned result is shared
+    between callers and is itself immutable.
+    """
+
+    return run_dcf_batch(assumptions, [scenario])[0]
+
 
-    projection = project_cash_flows(assumptions, scenario)
-    discounted_fcff = _discount(projection.fcff, scenario.wacc)
-    discounted_terminal = (
-        projection.terminal_value / (1 + scenario.wacc) ** assumptions.years
+def run_dcf_batch(
+    assumptions: Assumptions, scenarios: Sequence[ScenarioParams]
+) -> list[ScenarioResult]:
+    """Compute the DCF metrics for several scenarios in one vectorized pass.
+
+    Scenarios that are already a ``PreparedScenario`` reuse their attached
+    constants; plain parameters are prepared from ``assumptions``.
+    """
+
+    prepared = [prepare_scenario(assumptions, scenario) for scenario in scenarios]
+    if not prepared:
+        return []
+    shared = _shared_constants(prepared)
+    # Scenarios only differ in growth and WACC, so stack them as column vectors
+    # and broadcast against the projection years.
+    growth = np.array([scenario.growth_rate for scenario in prepared])[:, None]
+    wacc = _kernel_array([scenario.wacc for scenario in prepared])
+    _check_terminal_spread(wacc, shared.terminal_growth)
+    revenues = _project_revenues(
+        start=shared.starting_revenue,
+        growth_rate=growth,
+        years=shared.years,
     )
-    npv = _npv(discounted_fcff, discounted_terminal)
+    fcff = _kernel_array(_calculate_fcff(shared.fcff_coef, revenues))
     # Negative initial outlay approximated as year-zero revenue investment
-    initial_outlay = -assumptions.starting_revenue
-    irr = _irr([initial_outlay, *projection.fcff, projection.terminal_value])
-    return ScenarioResult(
-        name=scenario.name,
-        wacc=scenario.wacc,
-        npv=npv,
-        irr=irr,
-        revenues=projection.revenues,
-        fcff=projection.fcff,
-        terminal_value=projection.terminal_value,
+    terminal, npv, irr = dcf_batch(
+        fcff, wacc, shared.terminal_growth, -shared.starting_revenue, True
     )
+
+    return [
+        ScenarioResult(
+            name=scenario.name,
+            wacc=scenario.wacc,
+            npv=float(npv[index]),
+            irr=None if np.isnan(irr[index]) else float(irr[index]),
+            revenues=tuple(revenues[index].tolist()),
+            fcff=tuple(fcff[index].tolist()),
+            terminal_value=float(terminal[index]),
+        )
+        for index, scenario in enumerate(prepared)
+    ]
+
+
+def _shared_constants(prepared: Sequence[PreparedScenario]) -> PreparedScenario:
+    first = prepared[0]
+    for scenario in prepared[1:]:
+        if (
+            scenario.fcff_coef != first.fcff_coef
+            or scenario.terminal_growth != first.terminal_growth
+            or scenario.years != first.years
+            or scenario.starting_revenue != first.starting_revenue
+        ):
+            raise ValueError("Batched scenarios must share the same base assumptions.")
+    return first
@@ -1,12 +1,11 @@
-"""Pydantic data models for the DCF demo."""
+"""Data models for the DCF demo."""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
-from pydantic import BaseModel, BaseSettings, Field, validator
-from pydantic.fields import ModelField
+from pydantic import BaseSettings, Field
 
 
 class Settings(BaseSettings):
@@ -21,99 +20,133 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
     def resolve_paths(self) -> None:
-        """Ensure the configured directories exist."""
+        """Ensure the configured directories exist.
+
+        Agents do not create directories themselves; callers run this before
+        using them. ``Planner`` does so at the start of each pipeline stage.
+        """
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
 
-class Assumptions(BaseModel):
+def _check_range(
+    name: str,
+    value: float,
+    *,
+    gt: float | None = None,
+    ge: float | None = None,
+    lt: float | None = None,
+    le: float | None = None,
+) -> None:
+    if gt is not None and not value > gt:
+        raise ValueError(f"{name} must be greater than {gt}.")
+    if ge is not None and not value >= ge:
+        raise ValueError(f"{name} must be greater than or equal to {ge}.")
+    if lt is not None and not value < lt:
+        raise ValueError(f"{name} must be less than {lt}.")
+    if le is not None and not value <= le:
+        raise ValueError(f"{name} must be less than or equal to {le}.")
+
+
+@dataclass(frozen=True, slots=True)
+class Assumptions:
     """High-level financial assumptions used across scenarios."""
 
-    starting_revenue: float = Field(gt=0, description="Base revenue in year 0.")
-    growth_rate: float = Field(ge=-0.5, le=1.0, description="Annual revenue growth.")
-    gross_margin: float = Field(gt=0, lt=1, description="Gross margin percentage.")
-    opex_pct: float = Field(
-        gt=0, lt=1, description="Operating expenses as % of revenue."
-    )
-    tax_rate: float = Field(ge=0, lt=1, description="Effective tax rate.")
-    wacc: float = Field(gt=0, lt=1, description="Weighted average cost of capital.")
-    capex_pct: float = Field(
-        ge=0, lt=1, description="Capital expenditures as % of revenue."
-    )
-    delta_nwc_pct: float = Field(
-        ge=-1, lt=1, description="Change in net working capital as % of revenue."
-    )
-    terminal_growth: float = Field(
-        ge=-0.05, lt=0.2, description="Terminal growth rate."
-    )
-    years: int = Field(default=5, ge=1, le=10, description="Projection horizon.")
-    optimistic_growth_delta: float = Field(default=0.02, ge=0, le=0.2)
-    pessimistic_growth_delta: float = Field(default=0.02, ge=0, le=0.2)
-    optimistic_wacc_delta: float = Field(default=0.01, ge=0, le=0.1)
-    pessimistic_wacc_delta: float = Field(default=0.01, ge=0, le=0.1)
-
-    @validator("wacc")
-    def validate_wacc(cls, value: float, values: dict[str, Any]) -> float:
-        terminal_growth = values.get("terminal_growth", 0.0)
-        if value <= terminal_growth:
-            raise ValueError("WACC must be greater than terminal growth rate.")
-        return value
-
-    @validator("gross_margin", "opex_pct")
-    def validate_margin_sum(
-        cls, value: float, values: dict[str, Any], field: ModelField
-    ) -> float:
-        gross_margin = values.get(
-            "gross_margin", 0.0 if field.name == "gross_margin" else value
+    starting_revenue: float  # Base revenue in year 0.
+    growth_rate: float  # Annual revenue growth.
+    gross_margin: float  # Gross margin percentage.
+    opex_pct: float  # Operating expenses as % of revenue.
+    tax_rate: float  # Effective tax rate.
+    wacc: float  # Weighted average cost of capital.
+    capex_pct: float  # Capital expenditures as % of revenue.
+    delta_nwc_pct: float  # Change in net working capital as % of revenue.
+    terminal_growth: float  # Terminal growth rate.
+    years: int = 5  # Projection horizon.
+    optimistic_growth_delta: float = 0.02
+    pessimistic_growth_delta: float = 0.02
+    optimistic_wacc_delta: float = 0.01
+    pessimistic_wacc_delta: float = 0.01
+
+    def __post_init__(self) -> None:
+        _check_range("starting_revenue", self.starting_revenue, gt=0)
+        _check_range("growth_rate", self.growth_rate, ge=-0.5, le=1.0)
+        _check_range("gross_margin", self.gross_margin, gt=0, lt=1)
+        _check_range("opex_pct", self.opex_pct, gt=0, lt=1)
+        _check_range("tax_rate", self.tax_rate, ge=0, lt=1)
+        _check_range("wacc", self.wacc, gt=0, lt=1)
+        _check_range("capex_pct", self.capex_pct, ge=0, lt=1)
+        _check_range("delta_nwc_pct", self.delta_nwc_pct, ge=-1, lt=1)
+        _check_range("terminal_growth", self.terminal_growth, ge=-0.05, lt=0.2)
+        if not isinstance(self.years, int) or isinstance(self.years, bool):
+            raise ValueError("years must be an integer.")
+        _check_range("years", self.years, ge=1, le=10)
+        _check_range(
+            "optimistic_growth_delta", self.optimistic_growth_delta, ge=0, le=0.2
+        )
+        _check_range(
+            "pessimistic_growth_delta", self.pessimistic_growth_delta, ge=0, le=0.2
         )
-        opex_pct = values.get("opex_pct", 0.0 if field.name == "opex_pct" else value)
-        if gross_margin and opex_pct and (gross_margin + opex_pct) >= 0.99:
+        _check_range("optimistic_wacc_delta", self.optimistic_wacc_delta, ge=0, le=0.1)
+        _check_range(
+            "pessimistic_wacc_delta", self.pessimistic_wacc_delta, ge=0, le=0.1
+        )
+
+        if self.wacc <= self.terminal_growth:
+            raise ValueError("WACC must be greater than terminal growth rate.")
+        if (self.gross_margin + self.opex_pct) >= 0.99:
             raise ValueError(
                 "Gross margin plus opex percentage should leave room for profit."
             )
-        return value
 
 
-class ScenarioParams(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ScenarioParams:
     """Scenario-specific adjustments derived from base assumptions."""
 
     name: str
     growth_rate: float
     wacc: float
 
-    @validator("growth_rate")
-    def validate_growth(cls, value: float) -> float:
-        if value < -0.5:
+    def __post_init__(self) -> None:
+        if self.growth_rate < -0.5:
             raise ValueError("Growth rate is unrealistically low for scenario.")
-        return value
-
-    @validator("wacc")
-    def validate_wacc(cls, value: float) -> float:
-        if value <= 0 or value >= 1:
+        if self.wacc <= 0 or self.wacc >= 1:
             raise ValueError("WACC must be between 0 and 1.")
-        return value
 
 
-class ScenarioResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PreparedScenario(ScenarioParams):
+    """Scenario parameters bundled with the DCF constants of its assumptions."""
+
+    fcff_coef: float
+    terminal_growth: float
+    years: int
+    starting_revenue: float
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
     """DCF metrics computed for a single scenario."""
 
     name: str
     wacc: float
     npv: float
     irr: float | None
-    revenues: list[float]
-    fcff: list[float]
+    revenues: tuple[float, ...]
+    fcff: tuple[float, ...]
     terminal_value: float
 
 
-class SensitivityPoint(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SensitivityPoint:
     """Single point in the WACC sensitivity curve."""
 
     wacc: float
     npv: float
 
 
-class Results(BaseModel):
+@dataclass(slots=True)
+class Results:
     """Full pipeline output passed back to the UI layer."""
 
     scenarios: list[ScenarioResult]
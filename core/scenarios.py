@@ -2,10 +2,52 @@
 
 from __future__ import annotations
 
-from .models import Assumptions, ScenarioParams
+from functools import lru_cache
 
+from .models import Assumptions, PreparedScenario, ScenarioParams
 
-def build_scenarios(assumptions: Assumptions) -> list[ScenarioParams]:
+
+@lru_cache(maxsize=32)
+def fcff_coefficient(assumptions: Assumptions) -> float:
+    """Return FCFF as a fraction of revenue implied by the assumptions."""
+
+    # NOPAT less reinvestment collapses to a single coefficient on revenue.
+    ebit_margin = assumptions.gross_margin - assumptions.opex_pct
+    reinvestment = assumptions.capex_pct + assumptions.delta_nwc_pct
+    return ebit_margin * (1 - assumptions.tax_rate) - reinvestment
+
+
+def prepare_scenario(
+    assumptions: Assumptions, scenario: ScenarioParams
+) -> PreparedScenario:
+    """Attach the assumption-level DCF constants to a scenario.
+
+    An already prepared scenario is returned as is, provided its constants
+    were derived from ``assumptions``.
+    """
+
+    fcff_coef = fcff_coefficient(assumptions)
+    if isinstance(scenario, PreparedScenario):
+        if (
+            scenario.fcff_coef != fcff_coef
+            or scenario.terminal_growth != assumptions.terminal_growth
+            or scenario.years != assumptions.years
+            or scenario.starting_revenue != assumptions.starting_revenue
+        ):
+            raise ValueError("Prepared scenario was built from different assumptions.")
+        return scenario
+    return PreparedScenario(
+        name=scenario.name,
+        growth_rate=scenario.growth_rate,
+        wacc=scenario.wacc,
+        fcff_coef=fcff_coef,
+        terminal_growth=assumptions.terminal_growth,
+        years=assumptions.years,
+        starting_revenue=assumptions.starting_revenue,
+    )
+
+
+def build_scenarios(assumptions: Assumptions) -> list[PreparedScenario]:
     """Expand the base assumptions into base, optimistic, and pessimistic scenarios."""
 
     base = ScenarioParams(
@@ -23,4 +65,7 @@ def build_scenarios(assumptions: Assumptions) -> list[ScenarioParams]:
         growth_rate=assumptions.growth_rate - assumptions.pessimistic_growth_delta,
         wacc=min(0.99, assumptions.wacc + assumptions.pessimistic_wacc_delta),
     )
-    return [base, optimistic, pessimistic]
+    return [
+        prepare_scenario(assumptions, scenario)
+        for scenario in (base, optimistic, pessimistic)
+    ]
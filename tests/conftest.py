@@ -0,0 +1,78 @@
+from dataclasses import replace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from agents.planner import Planner
+from core._dcf_numba import dcf_batch
+from core.models import Assumptions, Results, Settings
+
+DEFAULT_ASSUMPTIONS = Assumptions(
+    starting_revenue=1_000_000,
+    growth_rate=0.08,
+    gross_margin=0.5,
+    opex_pct=0.3,
+    tax_rate=0.21,
+    wacc=0.1,
+    capex_pct=0.05,
+    delta_nwc_pct=0.02,
+    terminal_growth=0.02,
+    years=5,
+    optimistic_growth_delta=0.02,
+    pessimistic_growth_delta=0.02,
+    optimistic_wacc_delta=0.01,
+    pessimistic_wacc_delta=0.01,
+)
+
+# Field overrides applied on top of DEFAULT_ASSUMPTIONS for parametrized tests.
+ASSUMPTION_VARIANTS: dict[str, dict[str, Any]] = {
+    "base": {},
+    "optimistic": {"growth_rate": 0.11, "wacc": 0.09},
+    "pessimistic": {"growth_rate": 0.05, "wacc": 0.12},
+    "asymmetric_optimistic": {
+        "optimistic_growth_delta": 0.01,
+        "optimistic_wacc_delta": 0.005,
+    },
+    "asymmetric_pessimistic": {
+        "starting_revenue": 900_000,
+        "growth_rate": 0.07,
+        "gross_margin": 0.48,
+        "opex_pct": 0.28,
+        "pessimistic_growth_delta": 0.015,
+        "pessimistic_wacc_delta": 0.015,
+    },
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_dcf_kernel() -> None:
+    """Compile (or load from cache) the Numba DCF kernel before any test runs."""
+
+    fcff = np.ones((1, 2), dtype=np.float64)
+    wacc = np.full(1, 0.1, dtype=np.float64)
+    dcf_batch(fcff, wacc, 0.02, -1.0, True)
+
+
+@pytest.fixture(scope="session")
+def base_assumptions() -> Assumptions:
+    return DEFAULT_ASSUMPTIONS
+
+
+@pytest.fixture(scope="session", params=list(ASSUMPTION_VARIANTS))
+def assumptions(request: pytest.FixtureRequest) -> Assumptions:
+    return replace(DEFAULT_ASSUMPTIONS, **ASSUMPTION_VARIANTS[request.param])
+
+
+@pytest.fixture(scope="session")
+def pipeline_results(tmp_path_factory: pytest.TempPathFactory) -> Results:
+    """Run the full pipeline once and share its results across tests."""
+
+    settings = Settings(
+        data_dir=tmp_path_factory.mktemp("data"),
+        output_dir=tmp_path_factory.mktemp("artifacts"),
+    )
+    assumptions = replace(
+        DEFAULT_ASSUMPTIONS, **ASSUMPTION_VARIANTS["asymmetric_pessimistic"]
+    )
+    return Planner(settings).run_pipeline(assumptions)
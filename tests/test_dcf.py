@@ -1,38 +1,83 @@
-from core.dcf import run_dcf
-from core.models import Assumptions, ScenarioParams
+from dataclasses import replace
+from fractions import Fraction
 
+import numpy as np
+import pytest
 
-def base_assumptions() -> Assumptions:
-    return Assumptions(
-        starting_revenue=1_000_000,
-        growth_rate=0.08,
-        gross_margin=0.5,
-        opex_pct=0.3,
-        tax_rate=0.21,
-        wacc=0.1,
-        capex_pct=0.05,
-        delta_nwc_pct=0.02,
-        terminal_growth=0.02,
-        years=5,
-        optimistic_growth_delta=0.02,
-        pessimistic_growth_delta=0.02,
-        optimistic_wacc_delta=0.01,
-        pessimistic_wacc_delta=0.01,
-    )
+from core import _dcf_numba
+from core._dcf_numba import brent_root, dcf_batch, irr_bracketed
+from core.dcf import npv_for_waccs, project_cash_flows, run_dcf, run_dcf_batch
+from core.models import Assumptions, ScenarioParams
+from core.scenarios import build_scenarios
 
 
-def test_npv_positive_under_reasonable_inputs() -> None:
-    assumptions = base_assumptions()
+def test_npv_positive_under_reasonable_inputs(assumptions: Assumptions) -> None:
     scenario = ScenarioParams(
-        name="Base", growth_rate=assumptions.growth_rate, wacc=assumptions.wacc
+        name="Base",
+        growth_rate=assumptions.growth_rate,
+        wacc=assumptions.wacc,
     )
     result = run_dcf(assumptions, scenario)
     assert result.npv > 0
     assert result.irr is None or result.irr > -1
 
 
-def test_npv_decreases_with_higher_wacc() -> None:
-    assumptions = base_assumptions()
+@pytest.mark.parametrize(
+    ("cash_flows", "expected"),
+    [
+        ([-100.0, 60.0, 60.0], 0.1306623862918075),
+        # NPV only changes sign in the widest [1, 4] bracket.
+        ([-1.0, 2.5], 1.5),
+    ],
+)
+def test_irr_finds_bracketed_root(cash_flows: list[float], expected: float) -> None:
+    assert irr_bracketed(np.array(cash_flows)) == pytest.approx(expected, abs=1e-7)
+
+
+@pytest.mark.parametrize(
+    "cash_flows",
+    [
+        [100.0, 60.0, 60.0],  # No sign change in the cash flows.
+        [-100.0, 1.0],  # Root at -99%, below every bracket.
+    ],
+)
+def test_irr_is_nan_without_a_bracketed_root(cash_flows: list[float]) -> None:
+    assert np.isnan(irr_bracketed(np.array(cash_flows)))
+
+
+def test_brent_root_is_nan_when_it_does_not_converge(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The compiled kernel freezes the iteration limit, so run the Python source.
+    monkeypatch.setattr(_dcf_numba, "IRR_MAX_ITERATIONS", 2)
+    cash_flows = np.array([-100.0, 60.0, 60.0])
+    assert np.isnan(brent_root.py_func(cash_flows, 0.0, 1.0))
+
+
+def test_irr_is_none_when_every_cash_flow_is_negative(
+    base_assumptions: Assumptions,
+) -> None:
+    # Reinvestment above the after-tax margin makes every FCFF negative.
+    a = replace(base_assumptions, capex_pct=0.3)
+    result = run_dcf(a, ScenarioParams(name="Base", growth_rate=0.08, wacc=0.1))
+    assert max(result.fcff) < 0
+    assert result.irr is None
+
+
+def test_parallel_kernel_matches_serial_kernel() -> None:
+    rows = _dcf_numba.PARALLEL_MIN_ROWS
+    rng = np.random.default_rng(seed=7)
+    fcff = np.ascontiguousarray(rng.uniform(50_000, 150_000, size=(rows, 5)))
+    wacc = rng.uniform(0.05, 0.2, size=rows)
+
+    parallel = dcf_batch(fcff, wacc, 0.02, -1_000_000.0, True)
+    serial = tuple(np.empty(rows) for _ in range(3))
+    _dcf_numba._value_rows_serial(fcff, wacc, 0.02, -1_000_000.0, True, *serial)
+    for parallel_values, serial_values in zip(parallel, serial, strict=True):
+        assert parallel_values.tolist() == pytest.approx(serial_values.tolist())
+
+
+def test_npv_decreases_with_higher_wacc(assumptions: Assumptions) -> None:
     low_wacc = ScenarioParams(
         name="Low", growth_rate=assumptions.growth_rate, wacc=0.08
     )
@@ -42,3 +87,105 @@ def test_npv_decreases_with_higher_wacc() -> None:
     low_result = run_dcf(assumptions, low_wacc)
     high_result = run_dcf(assumptions, high_wacc)
     assert low_result.npv > high_result.npv
+
+
+def test_run_dcf_reuses_results_for_identical_inputs(
+    assumptions: Assumptions,
+) -> None:
+    scenario = ScenarioParams(name="Base", growth_rate=0.08, wacc=0.1)
+    first = run_dcf(assumptions, scenario)
+    second = run_dcf(assumptions, ScenarioParams("Base", 0.08, 0.1))
+    assert second is first
+
+
+def _per_year_dcf(
+    a: Assumptions, growth_rate: float, wacc: float
+) -> tuple[list[float], list[float], float, float]:
+    """Reference DCF computed year by year, independent of the kernel."""
+
+    revenues: list[float] = []
+    fcffs: list[float] = []
+    npv = 0.0
+    for year in range(1, a.years + 1):
+        revenue = a.starting_revenue * (1 + growth_rate) ** year
+        ebit = revenue * a.gross_margin - revenue * a.opex_pct
+        fcff = (
+            ebit * (1 - a.tax_rate) - revenue * a.capex_pct - revenue * a.delta_nwc_pct
+        )
+        revenues.append(revenue)
+        fcffs.append(fcff)
+        npv += fcff / (1 + wacc) ** year
+    terminal = fcffs[-1] * (1 + a.terminal_growth) / (wacc - a.terminal_growth)
+    npv += terminal / (1 + wacc) ** a.years
+    return revenues, fcffs, terminal, npv
+
+
+def test_vectorized_projection_matches_per_year_formula(
+    assumptions: Assumptions,
+) -> None:
+    a = assumptions
+    scenario = ScenarioParams(name="Base", growth_rate=a.growth_rate, wacc=a.wacc)
+    result = run_dcf(a, scenario)
+
+    revenues, fcff, terminal, npv = _per_year_dcf(a, a.growth_rate, a.wacc)
+    assert result.revenues == pytest.approx(revenues)
+    assert result.fcff == pytest.approx(fcff)
+    assert result.terminal_value == pytest.approx(terminal)
+    assert result.npv == pytest.approx(npv)
+
+
+def test_batched_scenarios_match_per_year_formula(assumptions: Assumptions) -> None:
+    scenarios = build_scenarios(assumptions)
+    batch = run_dcf_batch(assumptions, scenarios)
+    assert [result.name for result in batch] == ["Base", "Optimistic", "Pessimistic"]
+    for scenario, batched in zip(scenarios, batch, strict=True):
+        revenues, fcff, terminal, npv = _per_year_dcf(
+            assumptions, scenario.growth_rate, scenario.wacc
+        )
+        assert batched.wacc == scenario.wacc
+        assert batched.revenues == pytest.approx(revenues)
+        assert batched.fcff == pytest.approx(fcff)
+        assert batched.terminal_value == pytest.approx(terminal)
+        assert batched.npv == pytest.approx(npv)
+        # The IRR must zero the NPV of the outlay, the FCFF years and the
+        # terminal value, which the IRR cash flows place one period later.
+        assert batched.irr is not None
+        flows = [-assumptions.starting_revenue, *fcff, terminal]
+        residual = sum(
+            flow / (1 + batched.irr) ** year for year, flow in enumerate(flows)
+        )
+        assert residual == pytest.approx(0, abs=1e-6 * assumptions.starting_revenue)
+
+
+def test_wacc_sweep_matches_per_year_formula(assumptions: Assumptions) -> None:
+    a = assumptions
+    scenario = ScenarioParams(name="Base", growth_rate=a.growth_rate, wacc=a.wacc)
+    projection = project_cash_flows(a, scenario)
+    # Include rates just above terminal growth, where the terminal value dominates.
+    wacc_values = np.array(
+        [a.terminal_growth + 0.001, a.terminal_growth + 0.005, 0.08, a.wacc, 0.2]
+    )
+
+    npv = npv_for_waccs(a, projection, wacc_values)
+    expected = [_per_year_dcf(a, a.growth_rate, wacc)[3] for wacc in wacc_values]
+    assert npv == pytest.approx(expected)
+
+
+def test_npv_matches_exact_reference_over_long_horizons() -> None:
+    # An accuracy bound against exact rational arithmetic. The forward
+    # discount-factor recurrence would also pass; this guards against
+    # regressions rather than pinning the recurrence used.
+    years = 200
+    fcff = 1_000.0 * 1.03 ** np.arange(1, years + 1)
+    wacc, terminal_growth = 0.09, 0.02
+    terminal, npv, _ = dcf_batch(
+        fcff[None, :], np.array([wacc]), terminal_growth, -1.0, False
+    )
+
+    one_plus_rate = Fraction(1) + Fraction(wacc)
+    expected = sum(
+        Fraction(value) / one_plus_rate**year
+        for year, value in enumerate(fcff.tolist(), start=1)
+    )
+    expected += Fraction(float(terminal[0])) / one_plus_rate**years
+    assert npv[0] == pytest.approx(float(expected), rel=1e-13)
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core._fastcsv import write_frame_csv, write_numeric_csv
+
+
+def test_numeric_csv_writes_shortest_round_trip_values(tmp_path: Path) -> None:
+    path = tmp_path / "values.csv"
+    npv = 1440216.2055597298
+    write_numeric_csv(
+        path,
+        ["year", "wacc, rate", "npv"],
+        [np.array([1, 2]), np.array([0.06, 0.1 + 0.2]), np.array([npv, 99216.0])],
+    )
+
+    assert path.read_text().splitlines() == [
+        'year,"wacc, rate",npv',
+        f"1,0.06,{npv!r}",
+        "2,0.30000000000000004,99216.0",
+    ]
+
+
+def test_frame_csv_keeps_integers_and_booleans(tmp_path: Path) -> None:
+    path = tmp_path / "frame.csv"
+    write_frame_csv(path, pd.DataFrame({"id": [2**60 + 1], "flag": [True]}))
+    assert path.read_text().splitlines() == ["id,flag", f"{2**60 + 1},True"]
@@ -1,33 +1,100 @@
+import shutil
+from dataclasses import replace
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
 from agents.planner import Planner
-from core.models import Assumptions, Settings
+from agents.sensitivity_agent import SensitivityAgent
+from core.dcf import run_dcf
+from core.models import Assumptions, Results, ScenarioParams, Settings
+
+
+def test_pipeline_smoke(pipeline_results: Results) -> None:
+    assert len(pipeline_results.scenarios) == 3
+    assert pipeline_results.fcff_table
+    for artifact_path in pipeline_results.artifacts.values():
+        assert Path(artifact_path).exists()
+
 
+def test_report_rewrites_artifacts_for_its_analysis(
+    tmp_path: Path, base_assumptions: Assumptions
+) -> None:
+    settings = Settings(data_dir=tmp_path / "data", output_dir=tmp_path / "artifacts")
+    planner = Planner(settings)
+    first = planner.analyze(base_assumptions)
+    planner.report(planner.analyze(replace(base_assumptions, wacc=0.12)))
 
-def test_pipeline_smoke(tmp_path: Path) -> None:
-    settings = Settings(
-        data_dir=tmp_path / "data",
-        output_dir=tmp_path / "artifacts",
+    results = planner.report(first)
+    summary = pd.read_csv(
+        results.artifacts["scenario_summary"], float_precision="round_trip"
     )
+    assert summary["npv"].tolist() == [scenario.npv for scenario in first.scenarios]
+
+
+def test_planner_recreates_removed_output_dir(
+    tmp_path: Path, base_assumptions: Assumptions
+) -> None:
+    settings = Settings(data_dir=tmp_path / "data", output_dir=tmp_path / "artifacts")
     planner = Planner(settings)
-    assumptions = Assumptions(
-        starting_revenue=900_000,
-        growth_rate=0.07,
-        gross_margin=0.48,
-        opex_pct=0.28,
-        tax_rate=0.21,
-        wacc=0.1,
-        capex_pct=0.05,
-        delta_nwc_pct=0.02,
-        terminal_growth=0.02,
-        years=5,
-        optimistic_growth_delta=0.02,
-        pessimistic_growth_delta=0.015,
-        optimistic_wacc_delta=0.01,
-        pessimistic_wacc_delta=0.015,
+    planner.run_pipeline(base_assumptions)
+    shutil.rmtree(settings.output_dir)
+
+    results = planner.run_pipeline(base_assumptions)
+    assert Path(results.artifacts["scenario_summary"]).exists()
+
+
+def test_sensitivity_plot_is_opt_in(
+    tmp_path: Path, base_assumptions: Assumptions
+) -> None:
+    settings = Settings(data_dir=tmp_path / "data", output_dir=tmp_path / "artifacts")
+    settings.resolve_paths()
+    scenario = ScenarioParams(
+        name="Base",
+        growth_rate=base_assumptions.growth_rate,
+        wacc=base_assumptions.wacc,
     )
-    results = planner.run_pipeline(assumptions)
-    assert len(results.scenarios) == 3
-    assert results.fcff_table
-    for artifact_path in results.artifacts.values():
-        assert Path(artifact_path).exists()
+
+    _, artifacts = SensitivityAgent(settings).run(base_assumptions, scenario)
+    assert "sensitivity_plot" not in artifacts
+
+    _, artifacts = SensitivityAgent(settings, generate_plot=True).run(
+        base_assumptions, scenario
+    )
+    assert Path(artifacts["sensitivity_plot"]).exists()
+
+
+def test_sweep_baseline_matches_fresh_projection(
+    tmp_path: Path, assumptions: Assumptions
+) -> None:
+    agent = SensitivityAgent(Settings(output_dir=tmp_path))
+    scenario = ScenarioParams(
+        name="Base", growth_rate=assumptions.growth_rate, wacc=assumptions.wacc
+    )
+    baseline = run_dcf(assumptions, scenario)
+
+    reused = agent.sweep(assumptions, scenario, baseline=baseline)
+    fresh = agent.sweep(assumptions, scenario)
+    assert [point.wacc for point in reused] == [point.wacc for point in fresh]
+    assert [point.npv for point in reused] == pytest.approx(
+        [point.npv for point in fresh]
+    )
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        ScenarioParams(name="Other", growth_rate=0.08, wacc=0.1),
+        ScenarioParams(name="Base", growth_rate=0.1, wacc=0.1),
+        ScenarioParams(name="Base", growth_rate=0.08, wacc=0.12),
+    ],
+)
+def test_sweep_rejects_baseline_from_another_scenario(
+    tmp_path: Path, base_assumptions: Assumptions, other: ScenarioParams
+) -> None:
+    agent = SensitivityAgent(Settings(output_dir=tmp_path))
+    scenario = ScenarioParams(name="Base", growth_rate=0.08, wacc=0.1)
+    baseline = run_dcf(base_assumptions, other)
+    with pytest.raises(ValueError, match="different scenario"):
+        agent.sweep(base_assumptions, scenario, baseline=baseline)
@@ -1,24 +1,14 @@
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from core.dcf import run_dcf
 from core.models import Assumptions
 from core.scenarios import build_scenarios
 
 
-def test_three_scenarios_created() -> None:
-    assumptions = Assumptions(
-        starting_revenue=1_000_000,
-        growth_rate=0.08,
-        gross_margin=0.5,
-        opex_pct=0.3,
-        tax_rate=0.21,
-        wacc=0.1,
-        capex_pct=0.05,
-        delta_nwc_pct=0.02,
-        terminal_growth=0.02,
-        years=5,
-        optimistic_growth_delta=0.01,
-        pessimistic_growth_delta=0.02,
-        optimistic_wacc_delta=0.005,
-        pessimistic_wacc_delta=0.01,
-    )
+def test_three_scenarios_created(assumptions: Assumptions) -> None:
     scenarios = build_scenarios(assumptions)
     assert len(scenarios) == 3
     base, optimistic, pessimistic = scenarios
@@ -27,3 +17,57 @@ def test_three_scenarios_created() -> None:
     assert pessimistic.growth_rate < base.growth_rate
     assert optimistic.wacc < base.wacc
     assert pessimistic.wacc > base.wacc
+
+
+def test_prepared_scenario_rejects_other_assumptions(
+    base_assumptions: Assumptions,
+) -> None:
+    scenario = build_scenarios(base_assumptions)[0]
+    other = replace(base_assumptions, starting_revenue=2_000_000, years=8)
+    with pytest.raises(ValueError, match="different assumptions"):
+        run_dcf(other, scenario)
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("starting_revenue", 0.0),
+        ("growth_rate", -0.6),
+        ("growth_rate", 1.1),
+        ("gross_margin", 1.0),
+        ("opex_pct", 0.0),
+        ("tax_rate", 1.0),
+        ("wacc", 0.0),
+        ("capex_pct", -0.01),
+        ("delta_nwc_pct", 1.0),
+        ("terminal_growth", -0.06),
+        ("years", 0),
+        ("years", 11),
+        ("optimistic_growth_delta", 0.21),
+        ("pessimistic_wacc_delta", -0.01),
+    ],
+)
+def test_assumptions_reject_out_of_range_fields(
+    base_assumptions: Assumptions, field: str, value: Any
+) -> None:
+    with pytest.raises(ValueError, match=field):
+        replace(base_assumptions, **{field: value})
+
+
+def test_fractional_projection_years_are_rejected(
+    base_assumptions: Assumptions,
+) -> None:
+    with pytest.raises(ValueError, match="years"):
+        replace(base_assumptions, years=5.5)  # type: ignore[arg-type]
+
+
+def test_wacc_must_exceed_terminal_growth(base_assumptions: Assumptions) -> None:
+    with pytest.raises(ValueError, match="WACC must be greater"):
+        replace(base_assumptions, wacc=0.05, terminal_growth=0.05)
+
+
+def test_margin_and_opex_must_leave_room_for_profit(
+    base_assumptions: Assumptions,
+) -> None:
+    with pytest.raises(ValueError, match="room for profit"):
+        replace(base_assumptions, gross_margin=0.7, opex_pct=0.29)